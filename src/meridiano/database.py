@@ -8,7 +8,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import text
+from sqlalchemy import insert, text
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import and_, asc, desc, func, or_, select
 
@@ -281,6 +281,42 @@ def add_article(
             return None
 
 
+def add_articles_bulk(rows: List[Dict[str, Any]]) -> List[int]:
+    """Adds several articles in a single INSERT and commit, returning their IDs in input order.
+
+    Each row takes the same keys as add_article. Unlike add_article, a duplicate URL fails the
+    whole batch, in which case nothing is inserted and an empty list is returned.
+    """
+    if not rows:
+        return []
+
+    fetched_at = datetime.now()
+    rows = [{"image_url": None, **row, "fetched_at": fetched_at} for row in rows]
+
+    with get_session() as session:
+        try:
+            if "postgresql" in config.DATABASE_URL.lower():
+                try:
+                    session.exec(
+                        text(
+                            "SELECT setval("
+                            "pg_get_serial_sequence('articles','id'), "
+                            "COALESCE((SELECT MAX(id) FROM articles), 1))"
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(f"PostgreSQL sequence sync warning (non-critical): {e}")
+
+            statement = insert(Article).returning(Article.id, sort_by_parameter_order=True)
+            article_ids = list(session.exec(statement, params=rows).scalars())
+            session.commit()
+            print(f"Added {len(article_ids)} articles in bulk")
+            return article_ids
+        except IntegrityError:
+            session.rollback()
+            return []
+
+
 def get_unprocessed_articles(feed_profile: str, limit: int = 50) -> List[Dict[str, Any]]:
     """Gets articles that haven't been processed yet."""
     with get_session() as session:
@@ -3,30 +3,118 @@ Pytest configuration and shared fixtures.
 """
 
 import os
-import sys
 from datetime import datetime
+from types import MappingProxyType
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
-# Set test database URL before importing models
+# Set test database URL before anything imports meridiano (the engine is built at import time)
 os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
+
+from meridiano import database, models
+from meridiano.app import app as _app
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Single in-memory SQLite engine shared by the whole test session.
+
+    Under pytest-xdist every worker runs its own session, so each worker gets a private database.
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    # pysqlite emits its own BEGIN lazily and never around SAVEPOINTs, so take over
+    # transaction control to make nested transactions roll back properly.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Durability is irrelevant for a throwaway database; skip journaling and locking overhead
+        cursor = dbapi_connection.cursor()
+        cursor.executescript(
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA journal_mode=MEMORY;"
+            "PRAGMA locking_mode=EXCLUSIVE;"
+            "PRAGMA temp_store=MEMORY;"
+        )
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Schema is created once; tests are isolated by rolling back their SAVEPOINT
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def connection(engine):
+    """Connection holding an outer transaction that is never committed."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
 
 @pytest.fixture
+def db_session(connection, monkeypatch):
+    """Run the test inside a SAVEPOINT that is rolled back at teardown."""
+    savepoint = connection.begin_nested()
+
+    def _get_session():
+        # Each session works in its own nested SAVEPOINT, so commit/rollback never escape the test
+        return Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    monkeypatch.setattr(models, "get_session", _get_session)
+    monkeypatch.setattr(database, "get_session", _get_session)
+
+    yield connection
+
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Configure the Flask app once for the whole test session."""
+    _app.config["TESTING"] = True
+    _app.config["SECRET_KEY"] = "test-secret-key"
+    return _app
+
+
+SAMPLE_ARTICLE_DATA = MappingProxyType({
+    "url": "https://example.com/article1",
+    "title": "Test Article",
+    "published_date": datetime(2024, 1, 15, 10, 30),
+    "feed_source": "Test Feed",
+    "raw_content": "This is test content for an article.",
+    "feed_profile": "test",
+    "image_url": "https://example.com/image.jpg",
+})
+
+
+@pytest.fixture(scope="session")
 def sample_article_data():
-    """Sample article data for testing."""
-    return {
-        "url": "https://example.com/article1",
-        "title": "Test Article",
-        "published_date": datetime(2024, 1, 15, 10, 30),
-        "feed_source": "Test Feed",
-        "raw_content": "This is test content for an article.",
-        "feed_profile": "test",
-        "image_url": "https://example.com/image.jpg",
-    }
+    """Sample article data for testing, read-only so it can be shared; use .copy() to modify."""
+    return SAMPLE_ARTICLE_DATA
+
+
+@pytest.fixture(scope="session")
+def make_article_data():
+    """Factory returning a fresh sample article dict with the given fields overridden."""
+
+    def _make_article_data(**overrides):
+        return {**SAMPLE_ARTICLE_DATA, **overrides}
+
+    return _make_article_data
 
 
 @pytest.fixture
@@ -9,9 +9,6 @@ from unittest.mock import MagicMock, patch
 import feedparser
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../src")))
-
 from meridiano import database, models, run_briefing
 
 
@@ -2,36 +2,34 @@
 Tests for Flask application routes.
 """
 
-import os
-import sys
-
 import pytest
+from flask import url_for
+from sqlmodel import Session
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
-
-# Import app after setting up test database
-os.environ["DATABASE_URL"] = "sqlite:///:memory:"
-from meridiano.app import app
-from meridiano.database import add_article, create_collection
+from meridiano.database import add_article
+from meridiano.models import Collection
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the Flask app."""
-    app.config["TESTING"] = True
-    app.config["SECRET_KEY"] = "test-secret-key"
+def client(app, db_session):
+    """Create a test client for the Flask app, rolled back after each test."""
     with app.test_client() as client:
-        with app.app_context():
-            from meridiano.models import SQLModel, get_session, init_db
-
-            # Drop all tables to ensure a clean state before each test
-            SQLModel.metadata.drop_all(get_session().bind)
-            init_db()
         yield client
 
 
+@pytest.fixture(scope="class")
+def two_collections(connection):
+    """Create two collections once per test class, rolled back after the class."""
+    savepoint = connection.begin_nested()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        collections = [Collection(name="Collection 1"), Collection(name="Collection 2")]
+        session.add_all(collections)
+        session.commit()
+        collection_ids = tuple(c.id for c in collections)
+    yield collection_ids
+    savepoint.rollback()
+
+
 class TestIndexRoute:
     """Tests for the index (briefings list) route."""
 
@@ -39,7 +37,7 @@ class TestIndexRoute:
         """Test accessing the index route."""
         response = client.get("/")
         assert response.status_code == 200
-        assert b"Generated Briefings" in response.data or b"Briefings" in response.data
+        assert b"Briefings" in response.data
 
     def test_index_route_with_profile_filter(self, client):
         """Test index route with feed profile filter."""
@@ -50,27 +48,22 @@ class TestIndexRoute:
 class TestArticlesRoute:
     """Tests for the articles listing route."""
 
-    def test_articles_route_success(self, client):
-        """Test accessing the articles route."""
-        response = client.get("/articles")
+    @pytest.mark.parametrize(
+        "query_string",
+        [
+            "",
+            "?page=1",
+            "?search=test",
+            "?start_date=2024-01-01&end_date=2024-01-31",
+        ],
+        ids=["plain", "pagination", "search", "date_filter"],
+    )
+    def test_articles_route(self, client, query_string):
+        """Test accessing the articles route, with and without pagination, search and date filters."""
+        response = client.get("/articles" + query_string)
         assert response.status_code == 200
         assert b"Articles" in response.data
 
-    def test_articles_route_with_pagination(self, client):
-        """Test articles route with pagination."""
-        response = client.get("/articles?page=1")
-        assert response.status_code == 200
-
-    def test_articles_route_with_search(self, client):
-        """Test articles route with search term."""
-        response = client.get("/articles?search=test")
-        assert response.status_code == 200
-
-    def test_articles_route_with_date_filter(self, client):
-        """Test articles route with date filters."""
-        response = client.get("/articles?start_date=2024-01-01&end_date=2024-01-31")
-        assert response.status_code == 200
-
 
 class TestAddArticleRoute:
     """Tests for the add article route."""
@@ -79,29 +72,29 @@ class TestAddArticleRoute:
         """Test GET request to add article page."""
         response = client.get("/add_article")
         assert response.status_code == 200
-        assert b"Add New Article" in response.data or b"Add Article" in response.data
+        assert b"Add Article" in response.data
 
     def test_add_article_post_invalid_url(self, client):
         """Test POST with invalid URL."""
         response = client.post(
             "/add_article",
             data={"article_url": "not-a-url", "feed_profile_assign": "test"},
-            follow_redirects=True,
         )
-        assert response.status_code == 200
-        # Should show error message (check for flash message)
-        assert b"Invalid URL" in response.data or b"error" in response.data.lower()
+        assert response.status_code == 302
+        # Should flash an error message for the redirected page
+        with client.session_transaction() as sess:
+            assert ("error", "Invalid URL. Please include http:// or https://.") in sess["_flashes"]
 
     def test_add_article_post_empty_url(self, client):
         """Test POST with empty URL."""
         response = client.post(
             "/add_article",
             data={"article_url": "", "feed_profile_assign": "test"},
-            follow_redirects=True,
         )
-        assert response.status_code == 200
-        # Should show error message
-        assert b"required" in response.data.lower() or b"error" in response.data.lower()
+        assert response.status_code == 302
+        # Should flash an error message for the redirected page
+        with client.session_transaction() as sess:
+            assert ("error", "Article URL is required.") in sess["_flashes"]
 
 
 class TestViewArticleRoute:
@@ -123,51 +116,6 @@ class TestCollectionsRoutes:
         assert b"Collections" in response.data
         assert b"No collections yet." in response.data
 
-    def test_ajax_endpoints(self, client, sample_article_data):
-        """Test the AJAX endpoints for adding/removing articles and checking status."""
-        # Setup: Create an article and two collections
-        with app.app_context():
-            article_id = add_article(**sample_article_data)
-            coll1_id = create_collection("Collection 1")
-            coll2_id = create_collection("Collection 2")
-
-        # 1. Test Status Endpoint (initially in no collections)
-        response = client.get(f"/article/{article_id}/collections_status")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "ok"
-        print(data)
-        assert len(data["collections"]) == 2
-        assert not any(c["contains"] for c in data["collections"])
-
-        # 2. Test Add to Collection
-        response = client.post(f"/collection/{coll1_id}/add_article", json={"article_id": article_id})
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "ok"
-
-        # 3. Test Status Endpoint again (should be in Collection 1)
-        response = client.get(f"/article/{article_id}/collections_status")
-        assert response.status_code == 200
-        data = response.get_json()
-        # Order of collections isn't guaranteed, so find the one we care about
-        coll1_status = next(c for c in data["collections"] if c["id"] == coll1_id)
-        coll2_status = next(c for c in data["collections"] if c["id"] == coll2_id)
-        assert coll1_status["contains"]
-        assert not coll2_status["contains"]
-
-        # 4. Test Remove from Collection
-        response = client.post(f"/collection/{coll1_id}/remove_article", json={"article_id": article_id})
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["status"] == "ok"
-
-        # 5. Test Status Endpoint final time (should be in no collections)
-        response = client.get(f"/article/{article_id}/collections_status")
-        assert response.status_code == 200
-        data = response.get_json()
-        assert not any(c["contains"] for c in data["collections"])
-
     def test_collections_page_post_create(self, client):
         """Test POST /collections to create a new collection."""
         response = client.post(
@@ -191,3 +139,49 @@ class TestCollectionsRoutes:
         """Test viewing a non-existent collection."""
         response = client.get("/collection/999")
         assert response.status_code == 404
+
+
+class TestCollectionsAjaxRoutes:
+    """Tests for the collections AJAX endpoints."""
+
+    def test_ajax_endpoints(self, app, client, two_collections, sample_article_data):
+        """Test the AJAX endpoints for adding/removing articles and checking status."""
+        # Setup: Create an article; the two collections come from the class fixture
+        coll1_id, coll2_id = two_collections
+        with app.app_context():
+            article_id = add_article(**sample_article_data)
+
+        # Resolve the endpoint URLs once from the app's URL map
+        with app.test_request_context():
+            status_url = url_for("get_article_collections_status", article_id=article_id)
+            add_url = url_for("add_article_to_collection_route", collection_id=coll1_id)
+            remove_url = url_for("remove_article_from_collection_route", collection_id=coll1_id)
+
+        def assert_contains(expected_coll_ids):
+            """GET the status endpoint and check exactly expected_coll_ids contain the article."""
+            response = client.get(status_url)
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["status"] == "ok"
+            # Order of collections isn't guaranteed, so index them by id
+            status = {c["id"]: c["contains"] for c in data["collections"]}
+            assert status == {coll_id: coll_id in expected_coll_ids for coll_id in (coll1_id, coll2_id)}
+
+        # 1. Test Status Endpoint (initially in no collections)
+        assert_contains(set())
+
+        # 2. Test Add to Collection
+        response = client.post(add_url, json={"article_id": article_id})
+        assert response.status_code == 200
+        assert b'"status":"ok"' in response.data
+
+        # 3. Test Status Endpoint again (should be in Collection 1)
+        assert_contains({coll1_id})
+
+        # 4. Test Remove from Collection
+        response = client.post(remove_url, json={"article_id": article_id})
+        assert response.status_code == 200
+        assert b'"status":"ok"' in response.data
+
+        # 5. Test Status Endpoint final time (should be in no collections)
+        assert_contains(set())
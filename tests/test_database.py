@@ -3,24 +3,13 @@ Tests for database operations.
 """
 
 import json
-import os
-import sys
 
 import pytest
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
-from sqlmodel import SQLModel
-
-from meridiano.models import get_session, init_db
-
-# Set test database before importing database module
-os.environ["DATABASE_URL"] = "sqlite:///:memory:"
-
 from meridiano.database import (
     add_article,
     add_article_to_collection,
+    add_articles_bulk,
     create_collection,
     get_all_articles,
     get_article_by_id,
@@ -36,13 +25,8 @@ from meridiano.database import (
 
 
 @pytest.fixture(autouse=True)
-def setup_test_db():
-    """Initialize test database before each test and clean up after."""
-    # This setup ensures that each test function runs with a fresh database.
-    # It drops all tables, then re-creates them before the test runs.
-    with get_session() as session:
-        SQLModel.metadata.drop_all(session.bind)
-    init_db()
+def setup_test_db(db_session):
+    """Run each test against the shared test database, rolled back afterwards."""
     return
 
 
@@ -74,6 +58,35 @@ class TestAddArticle:
         assert article_id2 is None  # Should return None for duplicates
 
 
+class TestAddArticlesBulk:
+    """Tests for adding articles in bulk."""
+
+    def test_add_articles_bulk_success(self, make_article_data):
+        """Test that bulk insert returns IDs in input order."""
+        rows = [make_article_data(url=f"https://example.com/bulk{i}", title=f"Bulk {i}") for i in range(3)]
+
+        article_ids = add_articles_bulk(rows)
+
+        assert len(article_ids) == 3
+        for article_id, row in zip(article_ids, rows):
+            retrieved = get_article_by_id(article_id)
+            assert retrieved["url"] == row["url"]
+            assert retrieved["title"] == row["title"]
+            assert retrieved["fetched_at"] is not None
+
+    def test_add_articles_bulk_empty(self):
+        """Test that an empty batch is a no-op."""
+        assert add_articles_bulk([]) == []
+
+    def test_add_articles_bulk_duplicate(self, make_article_data):
+        """Test that a duplicate URL rejects the whole batch."""
+        add_article(**make_article_data())
+        rows = [make_article_data(url="https://example.com/new"), make_article_data()]
+
+        assert add_articles_bulk(rows) == []
+        assert len(get_all_articles()) == 1
+
+
 class TestGetArticle:
     """Tests for retrieving articles."""
 
@@ -105,14 +118,12 @@ class TestGetAllArticles:
         articles = get_all_articles()
         assert articles == []
 
-    def test_get_all_articles_with_data(self, sample_article_data):
+    def test_get_all_articles_with_data(self, make_article_data):
         """Test getting articles with data."""
         # Create multiple articles
-        for i in range(3):
-            article_data = sample_article_data.copy()
-            article_data["url"] = f"https://example.com/article{i}"
-            article_data["title"] = f"Article {i}"
-            add_article(**article_data)
+        add_articles_bulk(
+            [make_article_data(url=f"https://example.com/article{i}", title=f"Article {i}") for i in range(3)]
+        )
 
         articles = get_all_articles()
         assert len(articles) == 3
@@ -121,15 +132,14 @@ class TestGetAllArticles:
 class TestFeedProfiles:
     """Tests for feed profile operations."""
 
-    def test_get_distinct_feed_profiles(self, sample_article_data):
+    def test_get_distinct_feed_profiles(self, make_article_data):
         """Test getting distinct feed profiles."""
         # Create articles with different profiles
         profiles = ["tech", "brasil", "tech", "default"]
-        for idx, profile in enumerate(profiles):
-            article_data = sample_article_data.copy()
-            article_data["url"] = f"https://example.com/{profile}_{idx}"
-            article_data["feed_profile"] = profile
-            add_article(**article_data)
+        add_articles_bulk([
+            make_article_data(url=f"https://example.com/{profile}_{idx}", feed_profile=profile)
+            for idx, profile in enumerate(profiles)
+        ])
 
         distinct_profiles = get_distinct_feed_profiles(table="articles")
         assert len(distinct_profiles) == 3  # tech, brasil, default
@@ -158,7 +168,7 @@ class TestSaveBrief:
         assert retrieved["id"] == brief_id
         assert retrieved["brief_markdown"] == brief_markdown
         assert retrieved["feed_profile"] == feed_profile
-        assert retrieved["contributing_article_ids"] == json.dumps(contributing_article_ids)
+        assert json.loads(retrieved["contributing_article_ids"]) == contributing_article_ids
 
     def test_save_brief_sequential_ids(self):
         """Test that brief IDs are sequential."""
@@ -218,7 +228,7 @@ class TestSaveBrief:
         # Verify brief was saved with empty IDs
         retrieved = get_brief_by_id(brief_id)
         assert retrieved is not None
-        assert retrieved["contributing_article_ids"] == json.dumps([])
+        assert json.loads(retrieved["contributing_article_ids"]) == []
 
 
 class TestCollections:
@@ -272,15 +282,11 @@ class TestCollections:
         assert get_articles_for_collection(coll_id) == []
         assert get_article_count_for_collection(coll_id) == 0
 
-    def test_get_multiple_articles_for_collection(self, sample_article_data):
+    def test_get_multiple_articles_for_collection(self, make_article_data):
         """Test retrieving multiple articles from a collection."""
         coll_id = create_collection("Tech News")
-        article_ids = []
-        for i in range(3):
-            data = sample_article_data.copy()
-            data["url"] = f"http://example.com/{i}"
-            article_id = add_article(**data)
-            article_ids.append(article_id)
+        article_ids = add_articles_bulk([make_article_data(url=f"http://example.com/{i}") for i in range(3)])
+        for article_id in article_ids:
             add_article_to_collection(coll_id, article_id)
 
         articles = get_articles_for_collection(coll_id)
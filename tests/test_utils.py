@@ -2,13 +2,8 @@
 Tests for utility functions.
 """
 
-import os
-import sys
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
-
 from meridiano.utils import format_datetime
 
 